@@ -1,8 +1,45 @@
 import csv
 import io
+import mmap
+import os
+import pickle
+import re
+import sys
+import threading
 import time
+from array import array
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from functools import cached_property, lru_cache, partial
+from itertools import chain, islice, zip_longest
+from operator import itemgetter
 from pathlib import Path
 
+# Bump whenever the shape of any cached index changes.
+_CACHE_VERSION = 8
+
+# ---------- key normalisation (memoised: the same few keys recur on every query) ----------
+@lru_cache(maxsize=4096)
+def _norm(s):
+    return (s or "").strip().upper()
+
+# (thickness, value) pairs: key/projection without a lambda or tuple unpacking per item
+_first = itemgetter(0)
+_second = itemgetter(1)
+
+# cell is "Thickness" (any case, surrounding whitespace ignored); no strip()/lower() copies
+_is_thickness_cell = re.compile(r"\s*thickness\s*", re.IGNORECASE).fullmatch
+
+def _no_hardness(thickness):
+    """Hardness query for a CONCAT with no hardness column."""
+    return None, None
+
+# Shared read-only defaults for index misses: no per-call {} allocation, and the
+# caller indexes the result without a None check.
+_NO_ENTRIES = {}
+_EMPTY_ENTRY = {"labels": (), "query": _no_hardness}
+
 class MaterialDataStore:
     """
     Folder layout (relative to this file):
@@ -16,12 +53,17 @@ class MaterialDataStore:
           tabcodes.txt
           1.txt ... 8.txt
     All files are TAB-delimited. Robust encoding: UTF-8 (with BOM) → CP1252 fallback.
+    Parsed indices are cached in data/.cache/<name>.pkl, keyed on source mtime/size.
+    Only the conductivity index is built up front; the selection lists and the
+    hardness, tabcode and correction indices are built (or loaded from cache) on
+    first use.
     """
 
     def __init__(self):
         # Base folders
         self.data_dir = Path(__file__).parent / "data"
         self.corr_dir = self.data_dir / "correctiontables"
+        self.cache_dir = self.data_dir / ".cache"
 
         # Fixed files
         self.f_conductivity = self.data_dir / "baseconductivity.txt"
@@ -30,131 +72,331 @@ class MaterialDataStore:
         self.f_clad_min     = self.data_dir / "cladhardnessmin.txt"
         self.f_clad_max     = self.data_dir / "cladhardnessmax.txt"
         self.f_tabcodes     = self.corr_dir / "tabcodes.txt"
+        self.f_corr_tables  = [self.corr_dir / f"{n}.txt" for n in range(1, 9)]
+
+        # Let the kernel stream the sources in while we get going.
+        self._prefetch([self.f_conductivity, self.f_bare_min, self.f_bare_max,
+                        self.f_clad_min, self.f_clad_max, self.f_tabcodes,
+                        *self.f_corr_tables])
+
+        # Every lookup needs the conductivity index, so it stays eager.
+        self._cond_idx = self._cached("cond_idx", [self.f_conductivity],
+                                      self._build_conductivity_index)
+
+    # ---------- lazily built indices ----------
+    # Sorted selection lists, so cascading choices never rescan _cond_idx
+    @cached_property
+    def _tree(self):
+        """{SPEC: {MATERIAL: (TEMPER, ...)}}, every level in sorted order"""
+        # keys are canonical (stripped, upper-case); intern them again in case they
+        # came out of the pickle sidecar, which does not preserve interning.
+        # One sort of the (unique) keys orders every level; dict insertion order
+        # then carries it, so no level needs its own sort or set.
+        tree = {}
+        for key in sorted(self._cond_idx):
+            spec, mat, temp = map(sys.intern, key)
+            tree.setdefault(spec, {}).setdefault(mat, []).append(temp)
+        return {s: {m: tuple(ts) for m, ts in by_mat.items()} for s, by_mat in tree.items()}
+
+    @cached_property
+    def _concat_keys(self):
+        """{"SPEC-MAT-TEMP": (SPEC, MAT, TEMP)} for every key of _cond_idx"""
+        return {f"{s}-{m}-{t}": (s, m, t) for s, m, t in self._cond_idx}
+
+    def _key_for(self, concat):
+        """
+        CONCAT string -> the (SPEC, MAT, TEMP) tuple key _cond_idx uses, so lookups never
+        format a string. Resolved through the known keys, so '-' inside any part is fine;
+        only CONCATs with no conductivity row fall back to splitting on the last two '-'.
+        """
+        key = self._concat_keys.get(concat)
+        if key is None:
+            key = tuple(map(sys.intern, concat.rsplit("-", 2)))
+        return key
+
+    @cached_property
+    def _specs(self):
+        """(SPEC, ...), sorted"""
+        return tuple(self._tree)
+
+    @cached_property
+    def _materials(self):
+        """{SPEC: (MATERIAL, ...)}, so materials() hands out the same tuple every time"""
+        return {s: tuple(by_mat) for s, by_mat in self._tree.items()}
+
+    @cached_property
+    def bare(self):
+        """{(SPEC, MAT, TEMP): (array('d', thicknesses), (min_req, ...), (max_req, ...))}, sorted by thickness"""
+        # keys are resolved through _cond_idx, so the conductivity file is a source too
+        sources = [self.f_bare_min, self.f_bare_max]
+        return self._cached("bare", sources + [self.f_conductivity],
+                            lambda: self._build_hardness_pair(*sources))
+
+    @cached_property
+    def clad(self):
+        sources = [self.f_clad_min, self.f_clad_max]
+        return self._cached("clad", sources + [self.f_conductivity],
+                            lambda: self._build_hardness_pair(*sources))
+
+    # One index over both surfaces, so the UI and search_all do a single pair of
+    # lookups instead of picking between parallel bare/clad dicts:
+    # {(SPEC, MAT, TEMP): {"BARE"|"CLAD": {"labels": ("0.016", "0.0625", ...),
+    #                                       "query": f(thickness) -> (min, max)}}}
+    # "labels" are the sorted unique thicknesses, formatted for display.
+    @cached_property
+    def _surface_table(self):
+        table = {}
+        for surface, hardness in (("BARE", self.bare), ("CLAD", self.clad)):
+            labels = self._display_thicks(self._unique_thicks(hardness))
+            for k, rec in hardness.items():
+                table.setdefault(k, {})[surface] = {
+                    "labels": labels[k],
+                    "query": partial(self._nearest_pair, *rec),
+                }
+        return table
 
-        # Indices
-        self._cond_idx = {}   # {(SPEC, MATERIAL, TEMPER): (min, max)}
-        self._bare_min = {}   # {CONCAT: [(thickness, req_str), ...]}
-        self._bare_max = {}
-        self._clad_min = {}
-        self._clad_max = {}
-        self._tabcodes = {}   # {CONCAT: {"BARE": int|None, "CLAD": int|None}}
-        self._corr_tables = {}# {n: {"uncorr":[...], "thicks":[...], "grid":[[...]]}}
-
-        # Build everything
-        self._build_conductivity_index()
-        self._bare_min = self._build_hardness_table(self.f_bare_min)
-        self._bare_max = self._build_hardness_table(self.f_bare_max)
-        self._clad_min = self._build_hardness_table(self.f_clad_min)
-        self._clad_max = self._build_hardness_table(self.f_clad_max)
-        self._load_tabcodes()
-        self._load_correction_tables()
+    @staticmethod
+    def _display_thicks(thicks_by_concat):
+        # up to 4 decimals, trailing zeros dropped; formatted once per distinct tuple
+        by_tuple = {}
+        out = {}
+        for k, ths in thicks_by_concat.items():
+            disp = by_tuple.get(id(ths))
+            if disp is None:
+                disp = by_tuple[id(ths)] = tuple(
+                    "{:.4f}".format(t).rstrip("0").rstrip(".") if isinstance(t, float) else str(t)
+                    for t in ths)
+            out[k] = disp
+        return out
 
-    # ---------- encoding-robust TSV readers ----------
     @staticmethod
-    def _read_text_with_fallback(path):
-        try:
-            return path.read_text(encoding="utf-8-sig")
-        except UnicodeDecodeError:
-            return path.read_text(encoding="cp1252")
+    def _unique_thicks(table):
+        # most CONCATs of a file share one thickness array: dedupe each array once.
+        # Arrays are already sorted, so dict.fromkeys keeps that order without a re-sort.
+        by_array = {}
+        out = {}
+        for k, (thicks, _, _) in table.items():
+            uniq = by_array.get(id(thicks))
+            if uniq is None:
+                uniq = by_array[id(thicks)] = tuple(dict.fromkeys(thicks))
+            out[k] = uniq
+        return out
+
+    @cached_property
+    def tabcodes(self):
+        """{(SPEC, MAT, TEMP): {"BARE": int|None, "CLAD": int|None}}"""
+        return self._cached("tabcodes", [self.f_tabcodes, self.f_conductivity],
+                            self._load_tabcodes)
+
+    @cached_property
+    def corr_tables(self):
+        """{n: {"uncorr": array('d'), "thicks": array('d'), "grid": ((...), ...)}}, axes sorted"""
+        return self._cached("corr_tables", self.f_corr_tables, self._load_correction_tables)
 
     @staticmethod
-    def _read_tsv_rows(path):
-        text = MaterialDataStore._read_text_with_fallback(path)
-        reader = csv.reader(io.StringIO(text), dialect=csv.excel_tab)
-        return [row for row in reader]
+    def _prefetch(paths):
+        """Hint POSIX_FADV_WILLNEED for each file; a no-op where posix_fadvise is missing."""
+        if not hasattr(os, "posix_fadvise"):
+            return
+        for p in paths:
+            try:
+                fd = os.open(p, os.O_RDONLY)
+            except OSError:
+                continue
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            except OSError:
+                pass
+            finally:
+                os.close(fd)
 
+    # ---------- parsed-index sidecar cache ----------
     @staticmethod
-    def _read_tsv_dicts(path):
+    def _fingerprint(paths):
         """
-        Returns (header, rows_as_dicts). Pads/truncates row length to header length.
-        Header values are preserved (original case); use .lower() when matching.
+        (version, (name, mtime_ns, size) per source file). Kept as a plain tuple:
+        hash() of str is salted per process, so it can't be compared across runs.
         """
-        rows = MaterialDataStore._read_tsv_rows(path)
-        if not rows:
-            return [], []
-        header = rows[0]
-        L = len(header)
-        dicts = []
-        for r in rows[1:]:
-            r = (r + [""] * L)[:L]
-            dicts.append({header[i]: r[i] for i in range(L)})
-        return header, dicts
+        fp = [_CACHE_VERSION]
+        for p in paths:
+            try:
+                st = p.stat()
+                fp.append((p.name, st.st_mtime_ns, st.st_size))
+            except OSError:
+                fp.append((p.name, None, None))
+        return tuple(fp)
+
+    def _cached(self, name, sources, build):
+        """
+        Returns index `name` from its sidecar if the fingerprint of `sources` still
+        matches; otherwise calls build() and rewrites the sidecar.
+        """
+        fp = self._fingerprint(sources)
+        path = self.cache_dir / f"{name}.pkl"
+        try:
+            with path.open("rb") as f:
+                blob = pickle.load(f)
+            if isinstance(blob, dict) and blob.get("fp") == fp:
+                return blob["value"]
+        except Exception:
+            pass
+
+        value = build()
+        # per-writer temp name: two threads (or processes) may build the same index at
+        # once, and each must replace() only its own complete file
+        tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            self.cache_dir.mkdir(exist_ok=True)
+            with tmp.open("wb") as f:
+                pickle.dump({"fp": fp, "value": value}, f, protocol=5)
+            tmp.replace(path)
+        except OSError:
+            # read-only install: just parse on every start
+            with suppress(OSError):
+                tmp.unlink(missing_ok=True)
+        return value
+
+    # ---------- encoding-robust TSV readers ----------
+    @staticmethod
+    def _mmap_bytes(path):
+        """Read-only memory map of the whole file, or None if it is empty."""
+        with path.open("rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return None
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    @staticmethod
+    def _read_text_with_fallback(path):
+        # decode straight from the mapped pages: no intermediate bytes copy
+        mm = MaterialDataStore._mmap_bytes(path)
+        if mm is None:
+            return ""
+        with mm:
+            try:
+                return str(mm, "utf-8-sig")
+            except UnicodeDecodeError:
+                return str(mm, "cp1252")
 
-    # ---------- helpers ----------
     @staticmethod
-    def _norm(s):
-        return (s or "").strip().upper()
+    def _iter_tsv_rows(path):
+        text = MaterialDataStore._read_text_with_fallback(path)
+        yield from csv.reader(io.StringIO(text), dialect=csv.excel_tab)
 
+    @staticmethod
+    def _read_tsv_rows(path):
+        return list(MaterialDataStore._iter_tsv_rows(path))
+
+    # ---------- helpers ----------
     @staticmethod
     def _to_float(x):
+        # float() already ignores surrounding whitespace; no str()/strip() copies
         try:
-            return float(str(x).strip())
-        except Exception:
+            return float(x)
+        except (TypeError, ValueError):
             return None
 
     @staticmethod
     def _nearest_idx(values, target):
+        """values is sorted ascending; a tie goes to the lower index."""
         if not values:
             return None
-        best_i, best_d = 0, float("inf")
-        for i, v in enumerate(values):
-            d = abs(v - target)
-            if d < best_d:
-                best_i, best_d = i, d
-        return best_i
+        i = bisect_left(values, target)
+        if i == len(values) or (i > 0 and target - values[i - 1] <= values[i] - target):
+            return bisect_left(values, values[i - 1])
+        return i
 
     # ---------- conductivity ----------
     def _build_conductivity_index(self):
-        header, rows = self._read_tsv_dicts(self.f_conductivity)
-        cols = {c.strip().lower(): c for c in header}
+        rows = self._read_tsv_rows(self.f_conductivity)
+        header = [c.strip().lower() for c in rows[0]] if rows else []
         for need in ("spec", "material", "temper", "min", "max"):
-            if need not in cols:
+            if need not in header:
                 raise ValueError(f"{self.f_conductivity.name} missing column: {need}")
-        idx = {}
-        for row in rows:
-            spec = self._norm(row.get(cols["spec"]))
-            mat  = self._norm(row.get(cols["material"]))
-            temp = self._norm(row.get(cols["temper"]))
-            if not (spec and mat and temp):
-                continue
-            mn = self._to_float(row.get(cols["min"]))
-            mx = self._to_float(row.get(cols["max"]))
-            idx[(spec, mat, temp)] = (mn, mx)
-        self._cond_idx = idx
+
+        # column-wise: pad/truncate to header width, transpose once
+        L = len(header)
+        body = [(r + [""] * L)[:L] for r in rows[1:]]
+        columns = list(zip(*body)) if body else [()] * L
+        col = {name: columns[i] for i, name in enumerate(header)}
+
+        # normalise (and intern) / convert whole columns via map() instead of per-row calls
+        def upper_col(name):
+            return map(sys.intern, map(str.upper, map(str.strip, col[name])))
+
+        keys = zip(upper_col("spec"), upper_col("material"), upper_col("temper"))
+        mins = map(self._to_float, col["min"])
+        maxs = map(self._to_float, col["max"])
+        return {k: (mn, mx) for k, mn, mx in zip(keys, mins, maxs) if k[0] and k[1] and k[2]}
 
     # ---------- hardness (bare/clad min/max) ----------
-    def _build_hardness_table(self, path):
+    def _build_hardness_pair(self, min_path, max_path):
         """
-        Parses a hardness matrix:
+        Parses a min/max pair of hardness matrices in one go. Both files share one layout:
           - header row contains many CONCAT keys (A-B-C pattern),
           - somewhere is a 'Thickness' row header,
           - numeric thickness values are in a specific column (often 2nd).
-        Returns: { CONCAT_UPPER: [(thickness_float, requirement_str_or_None), ...] }
+        The layout is detected on the min file and reused (after a check) for the max file.
+        Returns: { (SPEC, MAT, TEMP): (array('d') of sorted thicknesses, min reqs, max reqs) },
+        requirements being str or None per thickness.
         """
-        rows = self._read_tsv_rows(path)
-        if not rows:
+        # only the head of each file is materialised; the body streams from the reader
+        it_min = self._iter_tsv_rows(min_path)
+        head_min, header_idx, concat_cols, thickness_col, data_start = self._hardness_layout(it_min)
+
+        it_max = self._iter_tsv_rows(max_path)
+        head_max = list(islice(it_max, max(header_idx + 1, data_start)))
+        if not head_min and not head_max:
             return {}
+        if header_idx >= len(head_max) or self._concat_columns(head_max[header_idx]) != concat_cols:
+            raise ValueError(f"{max_path.name} column layout differs from {min_path.name}")
+
+        mins = self._hardness_columns(chain(head_min[data_start:], it_min), concat_cols, thickness_col)
+        maxs = self._hardness_columns(chain(head_max[data_start:], it_max), concat_cols, thickness_col)
+        pair = {}
+        for concat_key, (thicks, vmin) in mins.items():
+            thicks_max, vmax = maxs[concat_key]
+            if thicks_max != thicks:
+                raise ValueError(f"{max_path.name} thickness rows differ from {min_path.name}")
+            pair[concat_key] = (thicks, vmin, vmax)
+        return pair
+
+    def _concat_columns(self, header):
+        """{column_index: (SPEC, MAT, TEMP)} for header cells matching the A-B-C pattern."""
+        concat_cols = {}
+        for ci, cell in enumerate(header):
+            key = (cell or "").strip()
+            if key and key.count('-') >= 2:
+                concat_cols[ci] = self._key_for(key.upper())
+        return concat_cols
 
-        # header row with many concat-like keys
-        header_idx = None
-        for i, r in enumerate(rows[:10]):
-            score = sum(1 for c in r if (c or "").count('-') >= 2)
-            if score >= 5:
+    def _hardness_layout(self, rows):
+        """
+        Pulls rows off the iterator only until the layout is known: the first 10 (header
+        search), through the 'Thickness' row plus the probe row after it (the whole file
+        if there is no 'Thickness' row). Header and Thickness rows are found in that
+        same single pass.
+        Returns (head_rows, header_idx, concat_cols, thickness_col, data_start).
+        """
+        head, header_idx, thickness_row, thickness_col = [], None, None, None
+        for r in rows:
+            i = len(head)
+            head.append(r)
+            # header row with many concat-like keys
+            if header_idx is None and i < 10 and sum(1 for c in r if c.count('-') >= 2) >= 5:
                 header_idx = i
+            # "Thickness" row
+            if thickness_row is None and any(map(_is_thickness_cell, r)):
+                thickness_row = i
+            if thickness_row is not None and len(head) >= max(10, thickness_row + 2):
                 break
+        if not head:
+            return head, 0, {}, None, 0
         if header_idx is None:
             header_idx = 0
 
-        # find "Thickness" row
-        thickness_row, thickness_col = None, None
-        for i, r in enumerate(rows):
-            if any((c or "").strip().lower() == "thickness" for c in r):
-                thickness_row = i
-                break
-
         # detect thickness column from next row
-        if thickness_row is not None and thickness_row + 1 < len(rows):
-            probe = rows[thickness_row + 1]
+        if thickness_row is not None and thickness_row + 1 < len(head):
+            probe = head[thickness_row + 1]
             for ci, cell in enumerate(probe):
                 s = (cell or "").strip()
                 try:
@@ -174,61 +416,76 @@ class MaterialDataStore:
                         pass
 
         # map concat columns from header
-        header = rows[header_idx]
-        concat_cols = {}
-        for ci, cell in enumerate(header):
-            key = (cell or "").strip()
-            if key and key.count('-') >= 2:
-                concat_cols[ci] = key.upper()
+        concat_cols = self._concat_columns(head[header_idx])
 
         # data starts after thickness row (if present), else after header
         data_start = (thickness_row + 1) if thickness_row is not None else (header_idx + 1)
-        table = {k: [] for k in concat_cols.values()}
+        return head, header_idx, concat_cols, thickness_col, data_start
 
-        for r in rows[data_start:]:
-            if thickness_col is None or thickness_col >= len(r):
-                continue
-            s = (r[thickness_col] or "").strip()
-            try:
-                t = float(s)
-            except Exception:
-                continue
-
-            for ci, concat_key in concat_cols.items():
-                val = r[ci] if ci < len(r) else ""
-                val = (val or "").strip()
-                table[concat_key].append((t, val or None))
-
-        for k in table:
-            table[k].sort(key=lambda x: x[0])
+    def _hardness_columns(self, rows, concat_cols, thickness_col):
+        """
+        rows: the data rows (after the Thickness row / header).
+        Returns: { (SPEC, MAT, TEMP): (array('d') of sorted thicknesses, requirement_str_or_None per thickness) }
+        """
+        if thickness_col is None:
+            return {k: (array("d"), ()) for k in concat_cols.values()}
+
+        # keep rows with a numeric thickness, sorted once (stable) by thickness
+        body = []
+        for r in rows:
+            if thickness_col < len(r):
+                t = self._to_float(r[thickness_col])
+                if t is not None:
+                    body.append((t, r))
+        body.sort(key=_first)
+        t_values = array("d", map(_first, body))
+
+        # transpose once, then build each CONCAT column without a per-row loop
+        columns = list(zip_longest(*map(_second, body), fillvalue=""))
+        blank = ("",) * len(body)
+        table = {}
+        for ci, concat_key in concat_cols.items():
+            col = columns[ci] if ci < len(columns) else blank
+            vals = tuple((v or "").strip() or None for v in col)
+            if concat_key in table:  # duplicate header key: merge and re-sort
+                pairs = sorted(list(zip(*table[concat_key])) + list(zip(t_values, vals)),
+                               key=_first)
+                table[concat_key] = (array("d", map(_first, pairs)),
+                                     tuple(map(_second, pairs)))
+            else:
+                table[concat_key] = (t_values, vals)
         return table
 
     # ---------- tabcodes (concat → table number per surface) ----------
+    @staticmethod
+    def _parse_code(x):
+        s = (x or "").strip()
+        if not s or s.lower().startswith("not"):
+            return None
+        try:
+            return int(float(s))  # e.g., "6.0" -> 6
+        except Exception:
+            return None
+
     def _load_tabcodes(self):
-        header, rows = self._read_tsv_dicts(self.f_tabcodes)
-        cols = {c.strip().lower(): c for c in header}
+        rows = self._iter_tsv_rows(self.f_tabcodes)
+        header = [c.strip().lower() for c in next(rows, [])]
+        pos = {name: i for i, name in enumerate(header)}
         for need in ("concat", "bare", "clad"):
-            if need not in cols:
+            if need not in pos:
                 raise ValueError(f"{self.f_tabcodes.name} missing column: {need}")
 
+        i_concat, i_bare, i_clad = pos["concat"], pos["bare"], pos["clad"]
+        L = len(header)
         tab = {}
-        for row in rows:
-            concat = self._norm(row.get(cols["concat"]))
-
-            def parse_code(x):
-                s = (x or "").strip()
-                if not s or s.lower().startswith("not"):
-                    return None
-                try:
-                    return int(float(s))  # e.g., "6.0" -> 6
-                except Exception:
-                    return None
-
-            tab[concat] = {
-                "BARE": parse_code(row.get(cols["bare"])),
-                "CLAD": parse_code(row.get(cols["clad"])),
+        for r in rows:
+            if len(r) < L:
+                r = r + [""] * (L - len(r))
+            tab[self._key_for(_norm(r[i_concat]))] = {
+                "BARE": self._parse_code(r[i_bare]),
+                "CLAD": self._parse_code(r[i_clad]),
             }
-        self._tabcodes = tab
+        return tab
 
     # ---------- numbered correction tables ----------
     def _load_correction_tables(self):
@@ -237,59 +494,81 @@ class MaterialDataStore:
           - Row 0: header -> first cell is label; remaining are THICKNESSES
           - Col 0: uncorrected %IACS values
           - Body: corrected %IACS values
+        The files are independent, so they are read concurrently.
         """
-        self._corr_tables = {}
-        for n in range(1, 9):
-            path = self.corr_dir / f"{n}.txt"
-            if not path.exists():
-                continue
-            rows = self._read_tsv_rows(path)
-            rows = [r for r in rows if any((c or "").strip() for c in r)]
-            if not rows:
+        tables = {}
+        paths = [p for p in self.f_corr_tables if p.exists()]
+        if not paths:
+            return tables
+        with ThreadPoolExecutor(max_workers=min(8, len(paths))) as ex:
+            results = list(ex.map(self._parse_one_correction, paths))
+        for n, table in results:
+            if table is not None:
+                tables[n] = table
+        return tables
+
+    def _parse_one_correction(self, path):
+        """Returns (n, {"uncorr":..., "thicks":..., "grid":...}) or (n, None) if empty."""
+        n = int(path.stem)
+        rows = (r for r in self._iter_tsv_rows(path) if any((c or "").strip() for c in r))
+        header = next(rows, None)
+        if header is None:
+            return n, None
+
+        to_float = self._to_float
+        thicks = [t for t in map(to_float, header[1:]) if t is not None]
+
+        uncorr = []
+        grid = []
+        for r in rows:
+            u = to_float(r[0] if len(r) > 0 else "")
+            if u is None:
                 continue
-
-            header = rows[0]
-            thicks = []
-            for cell in header[1:]:
-                t = self._to_float(cell)
-                if t is not None:
-                    thicks.append(t)
-
-            uncorr = []
-            grid = []
-            for r in rows[1:]:
-                u = self._to_float(r[0] if len(r) > 0 else "")
-                if u is None:
-                    continue
-                row_vals = []
-                for cell in r[1:1+len(thicks)]:
-                    row_vals.append(self._to_float(cell))
-                if len(row_vals) == len(thicks):
-                    uncorr.append(u)
-                    grid.append(row_vals)
-
-            self._corr_tables[n] = {"uncorr": uncorr, "thicks": thicks, "grid": grid}
+            row_vals = list(map(to_float, r[1:1+len(thicks)]))
+            if len(row_vals) == len(thicks):
+                uncorr.append(u)
+                grid.append(row_vals)
+
+        # sort both axes (co-permuting the grid) so lookups can bisect
+        row_order = sorted(range(len(uncorr)), key=uncorr.__getitem__)
+        col_order = sorted(range(len(thicks)), key=thicks.__getitem__)
+        return n, {
+            "uncorr": array("d", (uncorr[i] for i in row_order)),
+            "thicks": array("d", (thicks[i] for i in col_order)),
+            "grid": tuple(tuple(grid[ri][ci] for ci in col_order) for ri in row_order),
+        }
 
     # ---------- utilities ----------
     @staticmethod
-    def _nearest_value(pairs, thickness, tol=1e-6):
-        if not pairs:
+    def _nearest_value(thicks, vals, thickness, tol=1e-6):
+        """
+        thicks is sorted ascending. Exact hits (within tol) prefer a non-None value;
+        otherwise the nearest thickness wins, the lower one on a tie.
+        """
+        if not thicks:
             return None
-        exact = [v for t, v in pairs if abs(t - thickness) <= tol]
-        for v in exact:
-            if v is not None:
-                return v
-        if exact:
-            return exact[0]
-        best_v, best_d = None, float("inf")
-        for t, v in pairs:
-            d = abs(t - thickness)
-            if d < best_d:
-                best_v, best_d = v, d
-        return best_v
+        n = len(thicks)
+        lo = bisect_left(thicks, thickness - tol)
+        # single walk over the exact-match window: first non-None wins
+        i, hi = lo, thickness + tol
+        while i < n and thicks[i] <= hi:
+            if vals[i] is not None:
+                return vals[i]
+            i += 1
+        if i > lo:
+            return None  # exact hits, all without a requirement
+        if lo == n or (lo > 0 and thickness - thicks[lo - 1] <= thicks[lo] - thickness):
+            # first of any duplicates, as a left-to-right scan would pick
+            return vals[bisect_left(thicks, thicks[lo - 1])]
+        return vals[lo]
+
+    @staticmethod
+    def _nearest_pair(thicks, mins, maxs, thickness):
+        nearest = MaterialDataStore._nearest_value
+        return nearest(thicks, mins, thickness), nearest(thicks, maxs, thickness)
 
     def _correct_iacs(self, table_no, base_iacs, thickness):
-        T = self._corr_tables.get(table_no)
+        T = self.corr_tables.get(table_no)
         if not T:
             return None
         unc = T["uncorr"]; ths = T["thicks"]; grid = T["grid"]
@@ -301,33 +580,26 @@ class MaterialDataStore:
             return None
         return grid[ri][ci]
 
-    # ---------- public ----------
-    def search_all(self, spec, material, temper, thickness, surface):
+    # ---------- lookup ----------
+    def _resolve(self, spec_u, mat_u, temp_u, surf_u):
         """
-        Returns corrected conductivity min/max + hardness min/max (surface = "bare"|"clad").
+        Everything search_all needs that depends only on the (normalised) key,
+        not on thickness: (base_min, base_max, hardness query, tabcode).
         """
-        spec_u = self._norm(spec)
-        mat_u  = self._norm(material)
-        temp_u = self._norm(temper)
-        key_t  = (spec_u, mat_u, temp_u)
+        key = (spec_u, mat_u, temp_u)
 
         # 1) base conductivity
-        base_min, base_max = self._cond_idx.get(key_t, (None, None))
+        base_min, base_max = self._cond_idx.get(key, (None, None))
 
         # 2) hardness + tabcode
-        concat = f"{spec_u}-{mat_u}-{temp_u}"
-        if self._norm(surface) == "BARE":
-            hmin_pairs = self._bare_min.get(concat, [])
-            hmax_pairs = self._bare_max.get(concat, [])
-            code = self._tabcodes.get(concat, {}).get("BARE")
-        else:
-            hmin_pairs = self._clad_min.get(concat, [])
-            hmax_pairs = self._clad_max.get(concat, [])
-            code = self._tabcodes.get(concat, {}).get("CLAD")
-
-        t = float(thickness)
-        hard_min = self._nearest_value(hmin_pairs, t)
-        hard_max = self._nearest_value(hmax_pairs, t)
+        surface = "BARE" if surf_u == "BARE" else "CLAD"
+        hardness = self._surface_table.get(key, _NO_ENTRIES).get(surface, _EMPTY_ENTRY)["query"]
+        code = self.tabcodes.get(key, _NO_ENTRIES).get(surface)
+        return base_min, base_max, hardness, code
+
+    def _evaluate(self, resolved, t):
+        base_min, base_max, hardness, code = resolved
+        hard_min, hard_max = hardness(t)
 
         # 3) corrected conductivity via numbered tables (if available)
         corrected_min = base_min
@@ -345,9 +617,59 @@ class MaterialDataStore:
             "HardnessMax": hard_max,
         }
 
+    # ---------- public ----------
+    def specs(self):
+        """All specs, sorted."""
+        return self._specs
+
+    def materials(self, spec):
+        """Materials available for `spec`, sorted."""
+        return self._materials.get(_norm(spec), ())
+
+    def tempers(self, spec, material):
+        """Tempers available for `spec` + `material`, sorted."""
+        return self._tree.get(_norm(spec), _NO_ENTRIES).get(_norm(material), ())
+
+    def thickness_labels(self, spec, material, temper, surface):
+        """Selectable thicknesses for the key + surface ("bare"|"clad"), sorted and formatted for display."""
+        key = (_norm(spec), _norm(material), _norm(temper))
+        surface = "BARE" if _norm(surface) == "BARE" else "CLAD"
+        return self._surface_table.get(key, _NO_ENTRIES).get(surface, _EMPTY_ENTRY)["labels"]
+
+    def search_all(self, spec, material, temper, thickness, surface):
+        """
+        Returns corrected conductivity min/max + hardness min/max (surface = "bare"|"clad").
+        """
+        resolved = self._resolve(_norm(spec), _norm(material), _norm(temper), _norm(surface))
+        return self._evaluate(resolved, float(thickness))
+
+    def search_all_batch(self, specs, materials, tempers, thicknesses, surfaces):
+        """
+        search_all over parallel sequences; returns one result dict per row, in order.
+        Rows sharing spec/material/temper/surface resolve their tables only once.
+        """
+        groups = {}
+        results = []
+        for spec, mat, temp, th, surf in zip(specs, materials, tempers, thicknesses, surfaces):
+            key = (_norm(spec), _norm(mat), _norm(temp), _norm(surf))
+            resolved = groups.get(key)
+            if resolved is None:
+                resolved = groups[key] = self._resolve(*key)
+            results.append(self._evaluate(resolved, float(th)))
+        return results
+
+
+@lru_cache(maxsize=1)
+def get_store():
+    """
+    The process-wide MaterialDataStore, built on first call. Use get_store().search_all(...)
+    rather than constructing a store per call; the sidecar cache covers new processes.
+    """
+    return MaterialDataStore()
+
 
 # Example (optional)
 if __name__ == "__main__":
-    DATA = MaterialDataStore()
+    DATA = get_store()
     print(DATA.search_all("XXX3", "2024", "T8XX", 0.040, "bare"))
 
@@ -1,41 +1,37 @@
 # ui.py
+import threading
 import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from tkinter import ttk, messagebox
-from dataindex import MaterialDataStore
+from dataindex import get_store
 
 # --------------------- data layer ---------------------
-DATA = MaterialDataStore()
-
-def list_specs():
-    return sorted({spec for (spec, mat, temp) in DATA._cond_idx})
-
-def list_materials(spec):
-    su = (spec or "").strip().upper()
-    return sorted({mat for (sp, mat, temp) in DATA._cond_idx if sp == su})
-
-def list_tempers(spec, material):
-    su = (spec or "").strip().upper()
-    mu = (material or "").strip().upper()
-    return sorted({temp for (sp, mat, temp) in DATA._cond_idx if sp == su and mat == mu})
-
-def list_thicknesses(spec, material, temper, surface):
-    su = (spec or "").strip().upper()
-    mu = (material or "").strip().upper()
-    tu = (temper or "").strip().upper()
-    concat = f"{su}-{mu}-{tu}"
-    if (surface or "").strip().upper() == "BARE":
-        pairs_min = DATA._bare_min.get(concat, [])
-        pairs_max = DATA._bare_max.get(concat, [])
-    else:
-        pairs_min = DATA._clad_min.get(concat, [])
-        pairs_max = DATA._clad_max.get(concat, [])
-    th = {t for t, _ in pairs_min} | {t for t, _ in pairs_max}
-    return sorted(th)
+DATA = get_store()
+
+# Users flip back and forth between the same selections, so the per-key label
+# lookup is memoised (results are immutable tuples).
+@lru_cache(maxsize=512)
+def _thickness_labels(spec, material, temper, surface):
+    """Selectable thicknesses for the combobox, sorted and pre-formatted for display."""
+    return DATA.thickness_labels(spec, material, temper, surface)
 
 # --------------------- UI layer ---------------------
+# Surface choices; the combobox only ever yields these, so handlers use them as-is.
+_BARE = "BARE"
+_CLAD = "CLAD"
+
+# How often the Tk thread checks for a pending Calculate result (ms).
+_POLL_MS = 15
+
 class App(tk.Tk):
     def __init__(self):
         super().__init__()
+        # Only Calculate needs the tabcode/correction indices: load them in the
+        # background while the window comes up instead of on the first click.
+        # Not a daemon: exiting mid-build must still let it finish writing its sidecar,
+        # or the uniquely named temp file would be orphaned in data/.cache/.
+        threading.Thread(target=lambda: (DATA.tabcodes, DATA.corr_tables)).start()
         self.title("Conductivity & Hardness Calculator")
         self.geometry("700x420")
         self.resizable(False, False)
@@ -47,7 +43,7 @@ class App(tk.Tk):
         frm.pack(fill="x", padx=14, pady=14)
 
         ttk.Label(frm, text="Spec").grid(row=0, column=0, sticky="w", **pad)
-        self.cmb_spec = ttk.Combobox(frm, state="readonly", values=list_specs())
+        self.cmb_spec = ttk.Combobox(frm, state="readonly", values=DATA.specs())
         self.cmb_spec.grid(row=0, column=1, **pad)
 
         ttk.Label(frm, text="Material").grid(row=0, column=2, sticky="w", **pad)
@@ -59,7 +55,7 @@ class App(tk.Tk):
         self.cmb_temper.grid(row=1, column=1, **pad)
 
         ttk.Label(frm, text="Surface").grid(row=1, column=2, sticky="w", **pad)
-        self.cmb_surface = ttk.Combobox(frm, state="readonly", values=["BARE", "CLAD"])
+        self.cmb_surface = ttk.Combobox(frm, state="readonly", values=(_BARE, _CLAD))
         self.cmb_surface.grid(row=1, column=3, **pad)
 
         ttk.Label(frm, text="Thickness (in)").grid(row=2, column=0, sticky="w", **pad)
@@ -74,6 +70,12 @@ class App(tk.Tk):
         self.btn_reset = ttk.Button(btns, text="Reset", command=self.on_reset)
         self.btn_reset.pack(side="left", padx=6, pady=6)
 
+        # search_all runs on a single worker so the window stays responsive; only the
+        # Tk thread touches widgets, so it polls for the result rather than being called back.
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._calc_future = None
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
+
         # Output
         out = ttk.LabelFrame(self, text="Results")
         out.pack(fill="both", expand=True, padx=14, pady=8)
@@ -99,60 +101,70 @@ class App(tk.Tk):
         ttk.Label(out, text="Hardness Max:").grid(row=row, column=0, sticky="w", padx=12, pady=8)
         ttk.Label(out, textvariable=self.var_hard_max).grid(row=row, column=1, sticky="w", padx=12, pady=8)
 
-        # Wiring: cascading dropdown updates
+        # Wiring: cascading dropdown updates. Handlers only queue one after_idle pass,
+        # so a burst of selections (e.g. arrowing through specs) repopulates once.
+        # The pass compares against what the dependent lists were last built for and
+        # skips every level whose inputs did not change (re-selecting the same item).
+        self._pending = False
+        self._last_spec = self._last_mat = self._last_temp_surf = None
         self.cmb_spec.bind("<<ComboboxSelected>>", self.on_spec_changed)
         self.cmb_material.bind("<<ComboboxSelected>>", self.on_material_changed)
         self.cmb_temper.bind("<<ComboboxSelected>>", self.on_temper_or_surface_changed)
         self.cmb_surface.bind("<<ComboboxSelected>>", self.on_temper_or_surface_changed)
 
-        # Preselect first spec if any
+        # Preselect bare surface and the first spec if any
+        self.cmb_surface.set(_BARE)
         if self.cmb_spec["values"]:
             self.cmb_spec.current(0)
             self.on_spec_changed()
 
     # --- events ---
     def on_spec_changed(self, *_):
-        spec = self.cmb_spec.get()
-        mats = list_materials(spec)
-        self.cmb_material["values"] = mats
-        self.cmb_material.set("")
-        self.cmb_temper.set("")
-        self.cmb_thickness.set("")
-        self.cmb_temper["values"] = []
-        self.cmb_thickness["values"] = []
-        if mats:
-            self.cmb_material.current(0)
-            self.on_material_changed()
+        self._schedule_cascade()
 
     def on_material_changed(self, *_):
-        spec = self.cmb_spec.get()
-        mat = self.cmb_material.get()
-        temps = list_tempers(spec, mat)
-        self.cmb_temper["values"] = temps
-        self.cmb_temper.set("")
-        self.cmb_thickness.set("")
-        self.cmb_thickness["values"] = []
-        if temps:
-            self.cmb_temper.current(0)
-            self.on_temper_or_surface_changed()
+        self._schedule_cascade()
 
     def on_temper_or_surface_changed(self, *_):
+        self._schedule_cascade()
+
+    def _schedule_cascade(self):
+        if not self._pending:
+            self._pending = True
+            self.after_idle(self._apply_cascade)
+
+    def _apply_cascade(self):
+        self._pending = False
+
         spec = self.cmb_spec.get()
+        changed = spec != self._last_spec
+        if changed:
+            mats = DATA.materials(spec)
+            self.cmb_material.configure(values=mats)
+            self.cmb_material.set(mats[0] if mats else "")
         mat = self.cmb_material.get()
+
+        changed = changed or mat != self._last_mat
+        if changed:
+            temps = DATA.tempers(spec, mat)
+            self.cmb_temper.configure(values=temps)
+            self.cmb_temper.set(temps[0] if temps else "")
         temp = self.cmb_temper.get()
-        surf = self.cmb_surface.get() or "BARE"
-        thicks = list_thicknesses(spec, mat, temp, surf)
-        # format as strings with up to 4 decimals to look nice
-        disp = [("{:.4f}".format(t).rstrip("0").rstrip(".") if isinstance(t, float) else str(t)) for t in thicks]
-        self.cmb_thickness["values"] = disp
-        self.cmb_thickness.set("" if not disp else disp[0])
+        surf = self.cmb_surface.get() or _BARE
+
+        if changed or (temp, surf) != self._last_temp_surf:
+            disp = _thickness_labels(spec, mat, temp, surf) if temp else ()
+            self.cmb_thickness.configure(values=disp)
+            self.cmb_thickness.set("" if not disp else disp[0])
+
+        self._last_spec, self._last_mat, self._last_temp_surf = spec, mat, (temp, surf)
 
     def on_calculate(self):
-        spec = self.cmb_spec.get().strip()
-        mat = self.cmb_material.get().strip()
-        temp = self.cmb_temper.get().strip()
-        surf = (self.cmb_surface.get() or "BARE").strip().upper()
-        th_s = self.cmb_thickness.get().strip()
+        spec = self.cmb_spec.get()
+        mat = self.cmb_material.get()
+        temp = self.cmb_temper.get()
+        surf = self.cmb_surface.get() or _BARE
+        th_s = self.cmb_thickness.get()
 
         if not (spec and mat and temp and th_s and surf):
             messagebox.showwarning("Missing input", "Please select all fields.")
@@ -164,25 +176,47 @@ class App(tk.Tk):
             messagebox.showerror("Invalid thickness", f"Cannot parse thickness: {th_s}")
             return
 
-        result = DATA.search_all(spec, mat, temp, thickness, surf)
+        self.btn_calc.state(["disabled"])
+        self._calc_future = self._executor.submit(DATA.search_all, spec, mat, temp, thickness, surf)
+        self.after(_POLL_MS, self._poll_result, self._calc_future)
+
+    def _poll_result(self, fut):
+        if fut is not self._calc_future:
+            return  # reset (or closed) while it was running
+        if not fut.done():
+            self.after(_POLL_MS, self._poll_result, fut)
+            return
+        self._calc_future = None
+        self.btn_calc.state(["!disabled"])
+        self._apply_result(fut.result())
+
+    def _apply_result(self, result):
         self.var_corr_min.set("" if result["CorrectedMin"] is None else f"{result['CorrectedMin']:.2f}")
         self.var_corr_max.set("" if result["CorrectedMax"] is None else f"{result['CorrectedMax']:.2f}")
         self.var_hard_min.set(result["HardnessMin"] or "")
         self.var_hard_max.set(result["HardnessMax"] or "")
 
     def on_reset(self):
+        self._last_spec = self._last_mat = self._last_temp_surf = None
+        self._calc_future = None  # drop any result still on its way
+        self.btn_calc.state(["!disabled"])
         self.cmb_spec.set("")
         self.cmb_material.set("")
         self.cmb_temper.set("")
-        self.cmb_surface.set("")
+        self.cmb_surface.set(_BARE)  # same as at startup; handlers assume BARE anyway
         self.cmb_thickness.set("")
-        self.cmb_material["values"] = []
-        self.cmb_temper["values"] = []
-        self.cmb_thickness["values"] = []
+        self.cmb_material.configure(values=())
+        self.cmb_temper.configure(values=())
+        self.cmb_thickness.configure(values=())
         self.var_corr_min.set("")
         self.var_corr_max.set("")
         self.var_hard_min.set("")
         self.var_hard_max.set("")
 
+    def on_close(self):
+        self._calc_future = None
+        self._executor.shutdown(wait=False)
+        self.destroy()
+
 if __name__ == "__main__":
     App().mainloop()